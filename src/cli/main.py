@@ -8,18 +8,12 @@ lead researchers and specialized subagents for comprehensive topic investigation
 import argparse
 import asyncio
 
-from strands.types.content import ContentBlock
-
 from research_orchestrator import ResearchOrchestrator
+from research_orchestrator.orchestrator import extract_content_text
 from research_orchestrator.web.content_fetcher import WebContentFetcher
 from research_orchestrator.web.search.cache import SearchCache
 
 
-def extract_content_text(c: ContentBlock) -> str:
-    """Extract text content from a content block."""
-    return c.get("text", "")
-
-
 async def main():
     """
     Run the research orchestration system with user-provided topic
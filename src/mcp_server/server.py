@@ -16,6 +16,7 @@ from typing import Any
 from mcp.server.fastmcp import FastMCP
 
 from research_orchestrator import ResearchOrchestrator
+from research_orchestrator.settings import get_settings
 from research_orchestrator.web.content_fetcher import (
     WebContentFetcher,
 )
@@ -48,6 +49,12 @@ _progress_callbacks: dict[str, Callable] = {}
 _cache = SearchCache()
 _web_fetcher = WebContentFetcher()
 
+# Caps how many research workflows run at once. Each job runs in its own thread
+# and event loop, so a thread-level semaphore is used to queue the extras. It is
+# created on first use so importing the server doesn't require settings.
+_workflow_slots: threading.BoundedSemaphore | None = None
+_workflow_slots_lock = threading.Lock()
+
 
 class JobStatus:
     PENDING = "pending"
@@ -56,6 +63,17 @@ class JobStatus:
     FAILED = "failed"
 
 
+def get_workflow_slots() -> threading.BoundedSemaphore:
+    """Get the semaphore limiting concurrent workflows, creating it if needed."""
+    global _workflow_slots
+    with _workflow_slots_lock:
+        if _workflow_slots is None:
+            _workflow_slots = threading.BoundedSemaphore(
+                get_settings().max_concurrent_workflows
+            )
+        return _workflow_slots
+
+
 def create_orchestrator(progress_callback=None) -> ResearchOrchestrator:
     """Create a fresh research orchestrator instance for each job."""
     # Each job gets its own orchestrator to avoid state contamination
@@ -144,6 +162,29 @@ def update_job_progress(
 
 def execute_research_job_sync(job_id: str, topic: str) -> None:
     """Execute research job in background thread (synchronous wrapper)."""
+    try:
+        workflow_slots = get_workflow_slots()
+    except Exception as e:
+        # Settings failed to load; fail the job rather than leave it pending
+        _mark_job_failed(job_id, e)
+        return
+
+    # Jobs stay pending until a workflow slot frees up
+    with workflow_slots:
+        _execute_research_job(job_id, topic)
+
+
+def _mark_job_failed(job_id: str, error: Exception) -> None:
+    """Record a job failure and schedule its cleanup."""
+    update_job_status(job_id, JobStatus.FAILED, error=str(error))
+    # Schedule cleanup for failed jobs after 10 minutes
+    cleanup_timer = threading.Timer(600, lambda: cleanup_job_sync(job_id))
+    cleanup_timer.daemon = True
+    cleanup_timer.start()
+
+
+def _execute_research_job(job_id: str, topic: str) -> None:
+    """Run a research job to completion and record its outcome."""
     try:
         update_job_status(job_id, JobStatus.IN_PROGRESS)
 
@@ -201,11 +242,7 @@ def execute_research_job_sync(job_id: str, topic: str) -> None:
             loop.close()
 
     except Exception as e:
-        update_job_status(job_id, JobStatus.FAILED, error=str(e))
-        # Schedule cleanup for failed jobs after 10 minutes
-        cleanup_timer = threading.Timer(600, lambda: cleanup_job_sync(job_id))
-        cleanup_timer.daemon = True
-        cleanup_timer.start()
+        _mark_job_failed(job_id, e)
 
 
 # Removed fake progress simulation - now using real progress callbacks!
@@ -21,6 +21,22 @@ from .research_agent import ResearchAgent
 from .reviewer_agent import ReviewerAgent
 from .synthesis_agent import SynthesisAgent
 
+CITATION_REVIEW_PROMPT = """Please review this research report and identify any statements that need citations but currently lack them:
+
+---RESEARCH REPORT---
+{research_report}
+---END REPORT---
+
+Focus on factual claims, technical specifications, performance metrics, and research findings that should be backed by sources. Provide specific suggestions for where citations should be added."""
+
+RESEARCH_QUERY_PROMPT = """What current information can you find about "{query}"? Please search for details and provide a comprehensive overview with sources."""
+
+SUBAGENT_SYNTHESIS_PROMPT = """Consolidate these {report_count} research reports into one streamlined intermediate report:
+
+{reports_text}
+
+Create a synthesis that preserves all key information while reducing redundancy and token overhead. Maintain all citations and technical details."""
+
 
 class AgentManager:
     """Manages creation and coordination of research agents with hybrid model support."""
@@ -189,8 +205,8 @@ def create_research_specialist_tool(agent_manager):
         Returns:
             Synthesized research report consolidating all findings with optimized token usage
         """
-        tool_id = str(uuid.uuid4())
-        tool_start = time.time()
+        tool_id = uuid.uuid4().hex[:12]
+        tool_start = time.perf_counter()
         print(
             f"🚀 [{tool_id}] Streaming research_specialist started with {len(queries)} queries"
         )
@@ -203,7 +219,7 @@ def create_research_specialist_tool(agent_manager):
             _conduct_streaming_research_with_agents(queries, agent_manager, tool_id)
         )
 
-        tool_end = time.time()
+        tool_end = time.perf_counter()
         tool_time = tool_end - tool_start
         print(
             f"✅ [{tool_id}] Streaming research_specialist completed in {tool_time:.2f} seconds"
@@ -238,18 +254,12 @@ def create_citation_reviewer_tool(agent_manager: AgentManager):
         Returns:
             Detailed review highlighting missing citations and suggestions
         """
-        tool_id = str(uuid.uuid4())
-        tool_start = time.time()
+        tool_id = uuid.uuid4().hex[:12]
+        tool_start = time.perf_counter()
         print(f"📝 [{tool_id}] Citation reviewer started")
 
         # Use the reviewer agent to analyze the report
-        prompt = f"""Please review this research report and identify any statements that need citations but currently lack them:
-
----RESEARCH REPORT---
-{research_report}
----END REPORT---
-
-Focus on factual claims, technical specifications, performance metrics, and research findings that should be backed by sources. Provide specific suggestions for where citations should be added."""
+        prompt = CITATION_REVIEW_PROMPT.format(research_report=research_report)
 
         try:
             if agent_manager.reviewer_agent is None:
@@ -263,7 +273,7 @@ Focus on factual claims, technical specifications, performance metrics, and rese
                 map(extract_content_text, response.message["content"])
             )
 
-            tool_end = time.time()
+            tool_end = time.perf_counter()
             tool_time = tool_end - tool_start
             print(
                 f"✅ [{tool_id}] Citation reviewer completed in {tool_time:.2f} seconds"
@@ -272,7 +282,7 @@ Focus on factual claims, technical specifications, performance metrics, and rese
             return review_result
 
         except Exception as e:
-            tool_end = time.time()
+            tool_end = time.perf_counter()
             tool_time = tool_end - tool_start
             print(
                 f"❌ [{tool_id}] Citation reviewer failed in {tool_time:.2f} seconds: {e}"
@@ -296,13 +306,13 @@ async def _conduct_concurrent_research_with_agents(
     Returns:
         List of research reports corresponding to each query
     """
-    concurrent_start = time.time()
+    concurrent_start = time.perf_counter()
     print(f"🚀 [{tool_id}] Starting concurrent research for {len(queries)} queries")
 
     async def research_single_async(query: str, query_index: int) -> str:
         """Async wrapper for single research task using diverse subagent models."""
         query_id = f"{tool_id}-{query_index}"
-        query_start = time.time()
+        query_start = time.perf_counter()
         print(f"  📝 [{query_id}] Starting research for: {query[:50]}...")
 
         # Use different subagents from the AgentManager's pool for each query
@@ -310,7 +320,7 @@ async def _conduct_concurrent_research_with_agents(
         subagent_model_info = getattr(subagent.model, "model_id", "unknown")
         print(f"  🎭 [{query_id}] Using subagent model: {subagent_model_info}")
 
-        prompt = f"""What current information can you find about "{query}"? Please search for details and provide a comprehensive overview with sources."""
+        prompt = RESEARCH_QUERY_PROMPT.format(query=query)
 
         try:
             response = subagent(prompt)
@@ -319,7 +329,7 @@ async def _conduct_concurrent_research_with_agents(
 
             result = "".join(map(extract_content_text, response.message["content"]))
 
-            query_end = time.time()
+            query_end = time.perf_counter()
             query_time = query_end - query_start
             print(
                 f"  ✅ [{query_id}] Completed research for '{query[:50]}...' in {query_time:.2f} seconds"
@@ -336,7 +346,7 @@ async def _conduct_concurrent_research_with_agents(
 
             return result
         except Exception as e:
-            query_end = time.time()
+            query_end = time.perf_counter()
             query_time = query_end - query_start
             print(
                 f"  ❌ [{query_id}] Failed research for '{query[:50]}...' in {query_time:.2f} seconds: {e}"
@@ -365,7 +375,7 @@ async def _conduct_concurrent_research_with_agents(
             # result should be a string at this point
             processed_results.append(str(result))
 
-    concurrent_end = time.time()
+    concurrent_end = time.perf_counter()
     concurrent_time = concurrent_end - concurrent_start
     print(
         f"🎯 [{tool_id}] Concurrent research completed in {concurrent_time:.2f} seconds"
@@ -390,21 +400,20 @@ async def _conduct_concurrent_research_with_agents(
 
     # SYNTHESIS STEP: Consolidate all subagent reports into one intermediate report
     if len(processed_results) > 1:
-        synthesis_start = time.time()
+        synthesis_start = time.perf_counter()
         print(
             f"🔄 [{tool_id}] Synthesizing {len(processed_results)} subagent reports..."
         )
 
         # Prepare synthesis prompt with all subagent reports
-        reports_text = ""
-        for i, report in enumerate(processed_results, 1):
-            reports_text += f"\n--- SUBAGENT REPORT {i} ---\n{report}\n"
-
-        synthesis_prompt = f"""Consolidate these {len(processed_results)} research reports into one streamlined intermediate report:
-
-{reports_text}
+        reports_text = "".join(
+            f"\n--- SUBAGENT REPORT {i} ---\n{report}\n"
+            for i, report in enumerate(processed_results, 1)
+        )
 
-Create a synthesis that preserves all key information while reducing redundancy and token overhead. Maintain all citations and technical details."""
+        synthesis_prompt = SUBAGENT_SYNTHESIS_PROMPT.format(
+            report_count=len(processed_results), reports_text=reports_text
+        )
 
         try:
             if agent_manager.synthesis_agent is None:
@@ -418,7 +427,7 @@ Create a synthesis that preserves all key information while reducing redundancy
                 map(extract_content_text, synthesis_response.message["content"])
             )
 
-            synthesis_end = time.time()
+            synthesis_end = time.perf_counter()
             synthesis_time = synthesis_end - synthesis_start
             print(f"🎯 [{tool_id}] Synthesis completed in {synthesis_time:.2f} seconds")
 
@@ -426,7 +435,7 @@ Create a synthesis that preserves all key information while reducing redundancy
             return [synthesized_report]
 
         except Exception as e:
-            synthesis_end = time.time()
+            synthesis_end = time.perf_counter()
             synthesis_time = synthesis_end - synthesis_start
             print(
                 f"❌ [{tool_id}] Synthesis failed in {synthesis_time:.2f} seconds: {e}"
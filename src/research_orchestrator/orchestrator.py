@@ -5,8 +5,11 @@ Streaming architecture with real-time event processing.
 Uses async iterators and framework-native optimizations for enhanced performance.
 """
 
+import asyncio
+import threading
 import time
 import uuid
+from collections import OrderedDict
 
 from strands.types.content import ContentBlock
 
@@ -14,24 +17,98 @@ from .agents import create_agent_manager
 from .logger import setup_logging
 from .models import create_model
 from .processing import CitationProcessor, ResultFormatter, SourceTracker
+from .settings import get_settings
 from .types import ResearchResults
 from .web.content_fetcher import WebContentFetcher
 from .web.search.cache import SearchCache
 
+COMPLETE_WORKFLOW_PROMPT = """As lead researcher, conduct a complete research workflow for the topic: "{main_topic}"
+
+COMPLETE WORKFLOW:
+1. Generate 2-5 focused subtopics for comprehensive coverage
+2. Use research_specialist tool with ALL subtopics to get concurrent research reports
+3. Review initial findings to identify areas for deeper investigation
+4. Consider using research_specialist tool again with 1-2 follow-up topics to explore interesting areas in greater depth
+5. Create a comprehensive master synthesis report combining ALL findings (initial + follow-up)
+6. Include proper citations, structure, and formatting
+
+FOLLOW-UP RESEARCH CONSIDERATIONS:
+- After reviewing initial research, consider whether additional depth would enhance the final report
+- Good candidates for follow-up: advanced techniques, recent developments, practical implementation, emerging trends, detailed mechanisms
+- Follow-up topics should build upon interesting findings from the initial research
+- Use your judgment about whether the topic would benefit from additional investigation
+
+CRITICAL: Your final synthesis report MUST include proper citations:
+
+- Use numbered citations [1], [2], [3] throughout the text for every factual claim
+- Include a complete "Sources" section at the end listing all URLs used in numbered citations
+- Preserve ALL citations from ALL research rounds (initial + follow-up) - never omit any sources
+- Ensure every [1], [2], [3] reference in the text corresponds to a URL in the Sources section
+
+CITATION REVIEW WORKFLOW:
+1. After completing your master synthesis report, use the citation_reviewer tool to check for missing citations
+2. The reviewer will identify statements that need citations but currently lack them
+3. If significant issues are found, consider making improvements to the report before finalizing
+
+Return ONLY the final master synthesis report as your complete response. No JSON, no metadata, just the comprehensive research report that synthesizes all your findings with complete citations and source transparency."""
+
 
 def extract_content_text(c: ContentBlock) -> str:
     """Extract text content from a content block, handling reasoning content."""
     # Handle direct text content
-    if "text" in c:
-        return c["text"]
+    text = c.get("text")
+    if text is not None:
+        return text
     # Handle reasoning content format
-    elif "reasoningContent" in c:
-        reasoning = c["reasoningContent"]
-        if "reasoningText" in reasoning and "text" in reasoning["reasoningText"]:
-            return reasoning["reasoningText"]["text"]
+    reasoning = c.get("reasoningContent")
+    if reasoning is not None:
+        reasoning_text = reasoning.get("reasoningText")
+        if reasoning_text is not None:
+            return reasoning_text.get("text", "")
     return ""
 
 
+# Completed research results keyed by normalized topic. Kept at module level
+# because the MCP server creates a fresh orchestrator for every job; size and
+# TTL come from the results_cache_* settings.
+_results_cache: OrderedDict[str, tuple[float, ResearchResults]] = OrderedDict()
+_results_cache_lock = threading.Lock()
+
+
+def normalize_topic(topic: str) -> str:
+    """Normalize a research topic for cache lookups (case and whitespace)."""
+    return " ".join(topic.lower().split())
+
+
+def get_cached_results(topic: str) -> ResearchResults | None:
+    """Return cached research results for a topic if present and not expired."""
+    key = normalize_topic(topic)
+    ttl_seconds = get_settings().results_cache_ttl_seconds
+    with _results_cache_lock:
+        entry = _results_cache.get(key)
+        if entry is None:
+            return None
+
+        cached_at, results = entry
+        if time.monotonic() - cached_at > ttl_seconds:
+            del _results_cache[key]
+            return None
+
+        _results_cache.move_to_end(key)
+        return results
+
+
+def cache_results(topic: str, results: ResearchResults) -> None:
+    """Cache research results for a topic, evicting the least recently used."""
+    key = normalize_topic(topic)
+    max_size = get_settings().results_cache_max_size
+    with _results_cache_lock:
+        _results_cache[key] = (time.monotonic(), results)
+        _results_cache.move_to_end(key)
+        while len(_results_cache) > max_size:
+            _results_cache.popitem(last=False)
+
+
 class ResearchOrchestrator:
     """
     Streaming research orchestrator with real-time processing.
@@ -68,59 +145,31 @@ class ResearchOrchestrator:
         """
         Delegates the complete research workflow to the lead researcher.
         """
-        workflow_id = str(uuid.uuid4())
-        workflow_start = time.time()
+        workflow_id = uuid.uuid4().hex[:12]
+        workflow_start = time.perf_counter()
         self.research_logger.info(
             f"🕐 [{workflow_id}] Starting complete research workflow for: {main_topic}"
         )
 
         lead_researcher = self.agent_manager.get_lead_researcher()
 
-        prompt = f"""As lead researcher, conduct a complete research workflow for the topic: "{main_topic}"
-
-COMPLETE WORKFLOW:
-1. Generate 2-5 focused subtopics for comprehensive coverage
-2. Use research_specialist tool with ALL subtopics to get concurrent research reports
-3. Review initial findings to identify areas for deeper investigation
-4. Consider using research_specialist tool again with 1-2 follow-up topics to explore interesting areas in greater depth
-5. Create a comprehensive master synthesis report combining ALL findings (initial + follow-up)
-6. Include proper citations, structure, and formatting
-
-FOLLOW-UP RESEARCH CONSIDERATIONS:
-- After reviewing initial research, consider whether additional depth would enhance the final report
-- Good candidates for follow-up: advanced techniques, recent developments, practical implementation, emerging trends, detailed mechanisms
-- Follow-up topics should build upon interesting findings from the initial research
-- Use your judgment about whether the topic would benefit from additional investigation
-
-CRITICAL: Your final synthesis report MUST include proper citations:
-
-- Use numbered citations [1], [2], [3] throughout the text for every factual claim
-- Include a complete "Sources" section at the end listing all URLs used in numbered citations
-- Preserve ALL citations from ALL research rounds (initial + follow-up) - never omit any sources
-- Ensure every [1], [2], [3] reference in the text corresponds to a URL in the Sources section
-
-CITATION REVIEW WORKFLOW:
-1. After completing your master synthesis report, use the citation_reviewer tool to check for missing citations
-2. The reviewer will identify statements that need citations but currently lack them
-3. If significant issues are found, consider making improvements to the report before finalizing
-
-Return ONLY the final master synthesis report as your complete response. No JSON, no metadata, just the comprehensive research report that synthesizes all your findings with complete citations and source transparency."""
+        prompt = COMPLETE_WORKFLOW_PROMPT.format(main_topic=main_topic)
 
         try:
-            delegation_start = time.time()
+            delegation_start = time.perf_counter()
             self.research_logger.info(
                 f"⏱️ [{workflow_id}] Delegating to lead researcher..."
             )
 
-            response = lead_researcher(prompt)
+            # Run the blocking agent call off the event loop
+            response = await asyncio.to_thread(lead_researcher, prompt)
 
-            delegation_end = time.time()
-            delegation_time = delegation_end - delegation_start
+            delegation_time = time.perf_counter() - delegation_start
             self.research_logger.info(
                 f"✅ [{workflow_id}] Lead researcher completed in {delegation_time:.2f} seconds"
             )
 
-            processing_start = time.time()
+            processing_start = time.perf_counter()
             self.research_logger.info(f"🔄 [{workflow_id}] Processing response...")
 
             raw_synthesis = "".join(
@@ -132,8 +181,10 @@ Return ONLY the final master synthesis report as your complete response. No JSON
             self.source_tracker.add_urls(all_sources)
 
             # Process synthesis with citation deduplication and additional sources
-            processed_synthesis = self.result_formatter.process_synthesis_with_sources(
-                raw_synthesis, self.source_tracker, apply_deduplication=True
+            processed_synthesis, cited_urls = (
+                self.result_formatter.process_synthesis_with_citations(
+                    raw_synthesis, self.source_tracker, apply_deduplication=True
+                )
             )
 
             self.research_logger.info(
@@ -146,12 +197,12 @@ Return ONLY the final master synthesis report as your complete response. No JSON
                 master_synthesis=processed_synthesis,
                 source_tracker=self.source_tracker,
                 additional_context="via delegation to lead researcher",
+                cited_urls=cited_urls,
             )
 
-            processing_end = time.time()
+            processing_end = time.perf_counter()
             processing_time = processing_end - processing_start
-            workflow_end = time.time()
-            total_time = workflow_end - workflow_start
+            total_time = processing_end - workflow_start
 
             self.research_logger.info(
                 f"⚡ [{workflow_id}] Response processing completed in {processing_time:.2f} seconds"
@@ -163,8 +214,7 @@ Return ONLY the final master synthesis report as your complete response. No JSON
             return final_report
 
         except Exception as e:
-            workflow_end = time.time()
-            total_time = workflow_end - workflow_start
+            total_time = time.perf_counter() - workflow_start
             self.research_logger.error(
                 f"❌ [{workflow_id}] Complete workflow delegation failed for '{main_topic}' after {total_time:.2f} seconds: {e}"
             )
@@ -181,8 +231,16 @@ Return ONLY the final master synthesis report as your complete response. No JSON
         )
         self.research_logger.info("⚡ Using stable architecture with hybrid model pool")
 
+        cached_report = get_cached_results(main_topic)
+        if cached_report is not None:
+            self.research_logger.info(
+                f"♻️ Reusing cached research results for: {main_topic}"
+            )
+            return cached_report
+
         # Use stable workflow to avoid ValidationExceptions
         final_report = await self.complete_research_workflow(main_topic)
+        cache_results(main_topic, final_report)
 
         self.research_logger.info("✨ Research workflow completed")
         return final_report
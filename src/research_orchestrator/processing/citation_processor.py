@@ -6,9 +6,21 @@ from research reports. Designed to be highly testable in isolation.
 """
 
 import re
-from typing import Any, NamedTuple
+from functools import lru_cache
+from typing import NamedTuple
 from urllib.parse import urlparse, urlunparse
 
+_SOURCES_RE = re.compile(
+    r"##\s*Sources\s*\n\s*\n(.*?)(?=\n\s*\n\s*##|\n\s*\n\s*\*\*|\Z)", re.DOTALL
+)
+_URL_RE = re.compile(r"https?://[^\s\n]+")
+_CITATION_NUM_RE = re.compile(r"\[(\d+)\]")
+# Plain http(s) URL: scheme, host (no IPv6 brackets), and a path free of
+# whitespace or ;params, followed by a query, fragment, or the end of the string
+_HTTP_URL_RE = re.compile(
+    r"(https?)://([^/?#\s;\[\]]+)((?:/[^?#\s;]*)?)(?=[?#]|\Z)", re.IGNORECASE
+)
+
 
 class CitationEntry(NamedTuple):
     """Represents a parsed citation entry."""
@@ -19,22 +31,124 @@ class CitationEntry(NamedTuple):
     url: str
 
 
+class _UrlCitation(NamedTuple):
+    """A deduplicated citation entry for the rebuilt Sources section."""
+
+    new_num: int
+    site_name: str
+    title: str
+    original_url: str  # Keep original URL for display
+
+
 class DeduplicationResult(NamedTuple):
     """Result of citation deduplication process."""
 
     updated_text: str
     deduplicated_count: int
     final_count: int
+    # Normalized URLs cited in the updated Sources section, or None if unknown
+    cited_urls: set[str] | None = None
+
+
+def _search_sources_section(text: str) -> re.Match[str] | None:
+    """Find the Sources section, skipping the regex when the heading can't occur."""
+    # Cheap substring prefilter; the pattern allows "##Sources" too, so only
+    # the heading word itself is required
+    if "Sources" not in text:
+        return None
+    return _SOURCES_RE.search(text)
+
+
+def _parse_citation_at(
+    line: str, open_bracket: int
+) -> tuple[CitationEntry, int] | None:
+    """
+    Parse a citation entry starting at a "[" in a line, using string operations
+    rather than a regex.
+
+    Expected shape: [1] Site Name – "Title" – https://url.com (with en dashes)
+
+    Args:
+        line: A single line of text
+        open_bracket: Index of the "[" that starts the entry
+
+    Returns:
+        The CitationEntry and the index just past its URL, or None if no
+        citation entry starts there
+    """
+    close_bracket = line.find("]", open_bracket + 1)
+    if close_bracket == -1:
+        return None
+
+    old_num = line[open_bracket + 1 : close_bracket]
+    rest = line[close_bracket + 1 :]
+    if not old_num.isdigit() or not rest[:1].isspace():
+        return None
+
+    # Site name runs up to the first dash; the title is the quoted text after it
+    site_name, dash, rest = rest.partition("–")
+    site_name = site_name.strip()
+    rest = rest.lstrip()
+    if not dash or not site_name or not rest.startswith('"'):
+        return None
+
+    title, quote, rest = rest[1:].partition('"')
+    if not quote or not title:
+        return None
+
+    # The URL follows a second dash and ends at the first whitespace
+    separator, dash, rest = rest.partition("–")
+    if not dash or separator.strip():
+        return None
+
+    rest = rest.lstrip()
+    url = rest.split(maxsplit=1)[0] if rest else ""
+    scheme, _, address = url.partition("://")
+    if scheme not in ("http", "https") or not address:
+        return None
+
+    citation = CitationEntry(
+        old_num=old_num, site_name=site_name, title=title.strip(), url=url
+    )
+    return citation, len(line) - len(rest) + len(url)
+
+
+def _parse_citation_line(line: str) -> list[CitationEntry]:
+    """
+    Parse every citation entry in a single line.
+
+    Args:
+        line: A single line of text
+
+    Returns:
+        CitationEntry objects in the order they appear in the line
+    """
+    citations = []
+    open_bracket = line.find("[")
+    while open_bracket != -1:
+        parsed = _parse_citation_at(line, open_bracket)
+        if parsed is None:
+            open_bracket = line.find("[", open_bracket + 1)
+            continue
+
+        citation, end = parsed
+        citations.append(citation)
+        open_bracket = line.find("[", end)
+
+    return citations
 
 
 class CitationProcessor:
     """Processes citations and manages URL deduplication in research reports."""
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_url(url: str) -> str:
         """
         Normalize URLs for consistent comparison using proper URL parsing.
         Handles trailing slashes, case differences, query params, and fragments.
+        Results are memoized since the same URLs are normalized repeatedly while
+        deduplicating citations and filtering additional sources.
 
         Args:
             url: The URL to normalize
@@ -42,8 +156,16 @@ class CitationProcessor:
         Returns:
             Normalized URL string
         """
+        url = url.strip()
+
+        # Fast path for plain http(s) URLs, which covers nearly every source
+        match = _HTTP_URL_RE.match(url)
+        if match and match.group(2).isascii():
+            scheme, netloc, path = match.groups()
+            return f"{scheme.lower()}://{netloc.lower()}{path.rstrip('/').lower()}"
+
         try:
-            parsed = urlparse(url.strip())
+            parsed = urlparse(url)
 
             # Normalize components
             scheme = parsed.scheme.lower()
@@ -55,12 +177,14 @@ class CitationProcessor:
             # Ignore query parameters and fragments for deduplication
             # (they usually don't affect the core content)
 
-            # Reconstruct normalized URL
-            normalized = urlunparse((scheme, netloc, path, "", "", ""))
-            return normalized
-        except Exception:
-            # Fallback to original URL if parsing fails
-            return url.strip().lower()
+            # Reconstruct normalized URL, formatting the common absolute-URL case
+            # directly and leaving anything unusual to urlunparse
+            if scheme and netloc:
+                return f"{scheme}://{netloc}{path}"
+            return urlunparse((scheme, netloc, path, "", "", ""))
+        except ValueError:
+            # Fallback to original URL if parsing fails (e.g. malformed IPv6 netloc)
+            return url.lower()
 
     @staticmethod
     def extract_citations(text: str) -> list[CitationEntry]:
@@ -73,21 +197,11 @@ class CitationProcessor:
         Returns:
             List of CitationEntry objects
         """
-        # Parse citation entries: [1] Site Name – "Title" – https://url.com (with em dashes)
-        citation_pattern = (
-            r'\[(\d+)\]\s+([^–]+)\s+–\s+"([^"]+)"\s+–\s+(https?://[^\s\n]+)'
-        )
-        citations = re.findall(citation_pattern, text)
-
-        return [
-            CitationEntry(
-                old_num=old_num,
-                site_name=site_name.strip(),
-                title=title.strip(),
-                url=url,
-            )
-            for old_num, site_name, title, url in citations
-        ]
+        citations = []
+        for line in text.splitlines():
+            citations.extend(_parse_citation_line(line))
+
+        return citations
 
     @staticmethod
     def extract_sources_section(text: str) -> str | None:
@@ -100,10 +214,7 @@ class CitationProcessor:
         Returns:
             Sources section content or None if not found
         """
-        sources_pattern = (
-            r"##\s*Sources\s*\n\s*\n(.*?)(?=\n\s*\n\s*##|\n\s*\n\s*\*\*|\Z)"
-        )
-        sources_match = re.search(sources_pattern, text, re.DOTALL)
+        sources_match = _search_sources_section(text)
 
         return sources_match.group(1).strip() if sources_match else None
 
@@ -118,8 +229,7 @@ class CitationProcessor:
         Returns:
             Set of URLs found in the text
         """
-        url_pattern = r"https?://[^\s\n]+"
-        return set(re.findall(url_pattern, text))
+        return set(_URL_RE.findall(text))
 
     def deduplicate_citation_urls(self, master_synthesis: str) -> DeduplicationResult:
         """
@@ -134,11 +244,15 @@ class CitationProcessor:
         Returns:
             DeduplicationResult with updated text and statistics
         """
-        # Extract the Sources section
-        sources_section = self.extract_sources_section(master_synthesis)
-        if not sources_section:
+        # Extract the Sources section, keeping the match so it can be spliced later
+        sources_match = _search_sources_section(master_synthesis)
+        sources_section = sources_match.group(1).strip() if sources_match else None
+        if not sources_match or not sources_section:
             return DeduplicationResult(
-                updated_text=master_synthesis, deduplicated_count=0, final_count=0
+                updated_text=master_synthesis,
+                deduplicated_count=0,
+                final_count=0,
+                cited_urls=set(),
             )
 
         # Extract citations
@@ -150,59 +264,67 @@ class CitationProcessor:
 
         original_count = len(citations)
 
-        # Create URL to citation mapping (deduplicate by normalized URL)
-        url_to_citation: dict[str, dict[str, Any]] = {}
+        # Create URL to citation mapping (deduplicate by normalized URL), and the
+        # mapping from old citation numbers to new ones in the same pass
+        url_to_citation: dict[str, _UrlCitation] = {}
+        old_to_new_mapping: dict[str, str] = {}
         citation_counter = 1
 
         for citation in citations:
             normalized_url = self.normalize_url(citation.url)
-            if normalized_url not in url_to_citation:
-                url_to_citation[normalized_url] = {
-                    "new_num": citation_counter,
-                    "site_name": citation.site_name,
-                    "title": citation.title,
-                    "original_url": citation.url,  # Keep original URL for display
-                    "old_nums": [citation.old_num],
-                }
+            url_info = url_to_citation.get(normalized_url)
+            if url_info is None:
+                url_info = url_to_citation[normalized_url] = _UrlCitation(
+                    new_num=citation_counter,
+                    site_name=citation.site_name,
+                    title=citation.title,
+                    original_url=citation.url,
+                )
                 citation_counter += 1
-            else:
-                # Add this old citation number as an alias
-                url_to_citation[normalized_url]["old_nums"].append(citation.old_num)
+            # Duplicate URLs map their old number onto the first entry's number
+            old_to_new_mapping[citation.old_num] = str(url_info.new_num)
 
         final_count = len(url_to_citation)
 
-        # Create mapping from old citation numbers to new ones
-        old_to_new_mapping: dict[str, str] = {}
-        for url_info in url_to_citation.values():
-            for old_num in url_info["old_nums"]:
-                old_to_new_mapping[old_num] = str(url_info["new_num"])
-
-        # Replace citation numbers in the main text
-        updated_synthesis = master_synthesis
-        for old_num, new_num in old_to_new_mapping.items():
-            # Replace [old_num] with [new_num] throughout the text
-            updated_synthesis = re.sub(
-                rf"\[{re.escape(old_num)}\]", f"[{new_num}]", updated_synthesis
+        # Nothing to rewrite if there are no duplicates and numbering is already sequential
+        if final_count == original_count and all(
+            old_num == new_num for old_num, new_num in old_to_new_mapping.items()
+        ):
+            # The original section is kept as-is, including any lines the parser
+            # skipped, so report every URL in it rather than just parsed entries
+            return DeduplicationResult(
+                updated_text=master_synthesis,
+                deduplicated_count=0,
+                final_count=final_count,
+                cited_urls=self._normalized_urls_in(sources_section),
             )
 
+        # Replace citation numbers in a single pass, so that already-renumbered
+        # citations are never rewritten a second time. Bracketed numbers that
+        # are not in the Sources section are left as they are.
+        def renumber_citation(match: re.Match[str]) -> str:
+            old_num = match.group(1)
+            return f"[{old_to_new_mapping.get(old_num, old_num)}]"
+
+        def renumber(text: str) -> str:
+            return _CITATION_NUM_RE.sub(renumber_citation, text)
+
         # Rebuild the Sources section with deduplicated entries
         new_sources_lines = []
-        for _, info in url_to_citation.items():
+        for info in url_to_citation.values():
             new_sources_lines.append(
-                f'[{info["new_num"]}] {info["site_name"]} – "{info["title"]}" – {info["original_url"]}'
+                f'[{info.new_num}] {info.site_name} – "{info.title}" – {info.original_url}'
             )
 
         new_sources_section = "\n".join(new_sources_lines)
 
-        # Replace the old Sources section with the new one
-        sources_pattern = (
-            r"##\s*Sources\s*\n\s*\n(.*?)(?=\n\s*\n\s*##|\n\s*\n\s*\*\*|\Z)"
-        )
-        updated_synthesis = re.sub(
-            sources_pattern,
-            f"## Sources\n\n{new_sources_section}",
-            updated_synthesis,
-            flags=re.DOTALL,
+        # Splice the new Sources section in place of the old one, renumbering
+        # citations in the text around it
+        start, end = sources_match.span()
+        updated_synthesis = (
+            renumber(master_synthesis[:start])
+            + f"## Sources\n\n{new_sources_section}"
+            + renumber(master_synthesis[end:])
         )
 
         deduplicated_count = original_count - final_count
@@ -211,6 +333,7 @@ class CitationProcessor:
             updated_text=updated_synthesis,
             deduplicated_count=deduplicated_count,
             final_count=final_count,
+            cited_urls=set(url_to_citation),
         )
 
     def get_cited_urls_from_synthesis(self, synthesis_text: str) -> set[str]:
@@ -227,5 +350,8 @@ class CitationProcessor:
         if not sources_section:
             return set()
 
-        urls = self.extract_urls_from_text(sources_section)
-        return {self.normalize_url(url) for url in urls}
+        return self._normalized_urls_in(sources_section)
+
+    def _normalized_urls_in(self, text: str) -> set[str]:
+        """Normalize every URL found in a text."""
+        return {self.normalize_url(match.group(0)) for match in _URL_RE.finditer(text)}
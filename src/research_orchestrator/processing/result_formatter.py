@@ -19,6 +19,33 @@ class ResultFormatter:
         """Initialize the result formatter."""
         self.citation_processor = CitationProcessor()
 
+    @staticmethod
+    def format_additional_sources(
+        additional_sources: list[str], total_sources: int | None = None
+    ) -> str:
+        """
+        Format the Additional Research Sources section.
+
+        Args:
+            additional_sources: List of additional source URLs
+            total_sources: Total number of sources consulted, included in the
+                footer when given
+
+        Returns:
+            Section text, starting with a blank line separator
+        """
+        source_list = "\n".join(f"- {source}" for source in additional_sources)
+        footer = f"Additional sources: {len(additional_sources)}"
+        if total_sources is not None:
+            footer += f" | Total sources consulted: {total_sources}"
+
+        return (
+            "\n\n## Additional Research Sources\n\n"
+            "The following sources were also consulted during research "
+            "but may not be directly cited above:\n\n"
+            f"{source_list}\n\n{footer}"
+        )
+
     def add_additional_sources_section(
         self, synthesis_text: str, additional_sources: list[str]
     ) -> str:
@@ -35,19 +62,7 @@ class ResultFormatter:
         if not additional_sources:
             return synthesis_text
 
-        additional_sources_section = "\n\n## Additional Research Sources\n\n"
-        additional_sources_section += (
-            "The following sources were also consulted during research "
-            "but may not be directly cited above:\n\n"
-        )
-
-        for source in additional_sources:
-            additional_sources_section += f"- {source}\n"
-
-        total_sources = len(additional_sources)
-        additional_sources_section += f"\nAdditional sources: {total_sources}"
-
-        return synthesis_text + additional_sources_section
+        return synthesis_text + self.format_additional_sources(additional_sources)
 
     def create_research_results(
         self,
@@ -55,6 +70,7 @@ class ResultFormatter:
         master_synthesis: str,
         source_tracker: SourceTracker,
         additional_context: str = "",
+        cited_urls: set[str] | None = None,
     ) -> ResearchResults:
         """
         Create a complete ResearchResults object from the processed components.
@@ -64,12 +80,17 @@ class ResultFormatter:
             master_synthesis: The processed master synthesis text
             source_tracker: SourceTracker instance with all tracked sources
             additional_context: Additional context for the summary
+            cited_urls: Normalized cited URLs, if already known (skips re-parsing
+                the synthesis)
 
         Returns:
             Complete ResearchResults object
         """
-        all_sources = source_tracker.get_all_sources()
-        source_stats = source_tracker.get_source_statistics(master_synthesis)
+        # One URL per distinct page, matching the counts in source_stats
+        all_sources = source_tracker.get_unique_sources()
+        source_stats = source_tracker.get_source_statistics(
+            master_synthesis, cited_urls
+        )
 
         # Create summary with statistics
         summary_parts = [
@@ -115,34 +136,48 @@ class ResultFormatter:
         Returns:
             Processed synthesis text with deduplication and additional sources
         """
+        processed_synthesis, _ = self.process_synthesis_with_citations(
+            synthesis_text, source_tracker, apply_deduplication
+        )
+        return processed_synthesis
+
+    def process_synthesis_with_citations(
+        self,
+        synthesis_text: str,
+        source_tracker: SourceTracker,
+        apply_deduplication: bool = True,
+    ) -> tuple[str, set[str]]:
+        """
+        Process synthesis text and return the cited URLs found along the way.
+
+        Args:
+            synthesis_text: Raw synthesis text from research
+            source_tracker: SourceTracker with all research sources
+            apply_deduplication: Whether to apply URL deduplication
+
+        Returns:
+            Tuple of (processed synthesis text, normalized cited URLs), so that
+            create_research_results can reuse the cited URLs
+        """
         # Apply citation deduplication if requested
         if apply_deduplication:
             dedup_result = self.citation_processor.deduplicate_citation_urls(
                 synthesis_text
             )
             processed_synthesis = dedup_result.updated_text
+            cited_urls = dedup_result.cited_urls
         else:
             processed_synthesis = synthesis_text
+            cited_urls = None
 
-        # Add additional sources section
-        additional_sources = source_tracker.get_additional_sources(processed_synthesis)
+        # Add additional sources section, reusing the cited URLs from deduplication
+        additional_sources, cited_urls = source_tracker.compute_source_view(
+            processed_synthesis, cited_urls
+        )
         if additional_sources:
-            total_sources = len(source_tracker.get_all_sources())
-
-            additional_sources_section = "\n\n## Additional Research Sources\n\n"
-            additional_sources_section += (
-                "The following sources were also consulted during research "
-                "but may not be directly cited above:\n\n"
+            processed_synthesis += self.format_additional_sources(
+                additional_sources,
+                total_sources=len(source_tracker.get_unique_sources()),
             )
 
-            for source in additional_sources:
-                additional_sources_section += f"- {source}\n"
-
-            additional_sources_section += (
-                f"\nAdditional sources: {len(additional_sources)} | "
-                f"Total sources consulted: {total_sources}"
-            )
-
-            processed_synthesis += additional_sources_section
-
-        return processed_synthesis
+        return processed_synthesis, cited_urls
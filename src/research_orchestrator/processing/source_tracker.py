@@ -15,6 +15,10 @@ class SourceTracker:
         """Initialize the source tracker."""
         self.citation_processor = CitationProcessor()
         self.tracked_urls: set[str] = set()
+        # Normalized form of each tracked URL, computed once when it is added
+        self.normalized_urls: dict[str, str] = {}
+        # Sorted view of tracked_urls, rebuilt lazily after the set changes
+        self._sorted_urls: list[str] | None = None
 
     def add_url(self, url: str) -> None:
         """
@@ -23,7 +27,10 @@ class SourceTracker:
         Args:
             url: URL to add to tracking
         """
-        self.tracked_urls.add(url)
+        if url not in self.normalized_urls:
+            self.tracked_urls.add(url)
+            self.normalized_urls[url] = self.citation_processor.normalize_url(url)
+            self._sorted_urls = None
 
     def add_urls(self, urls: list[str]) -> None:
         """
@@ -32,7 +39,8 @@ class SourceTracker:
         Args:
             urls: List of URLs to add to tracking
         """
-        self.tracked_urls.update(urls)
+        for url in urls:
+            self.add_url(url)
 
     def get_all_sources(self) -> list[str]:
         """
@@ -41,56 +49,118 @@ class SourceTracker:
         Returns:
             Sorted list of all tracked URLs
         """
-        return sorted(self.tracked_urls)
+        return list(self._get_sorted_urls())
 
-    def get_additional_sources(self, synthesis_text: str) -> list[str]:
+    def get_unique_sources(self) -> list[str]:
         """
-        Get sources that were tracked but not directly cited in the synthesis.
+        Get one tracked URL per distinct page (normalized URL), sorted.
+
+        Returns:
+            Sorted list of tracked URLs with variants of the same page removed
+        """
+        seen_urls: set[str] = set()
+        unique_sources = []
+        for source in self._get_sorted_urls():
+            normalized_url = self.normalized_urls[source]
+            if normalized_url not in seen_urls:
+                seen_urls.add(normalized_url)
+                unique_sources.append(source)
+        return unique_sources
+
+    def _get_sorted_urls(self) -> list[str]:
+        """Return the cached sorted URL list; callers must not mutate it."""
+        if self._sorted_urls is None:
+            self._sorted_urls = sorted(self.tracked_urls)
+        return self._sorted_urls
+
+    def compute_source_view(
+        self, synthesis_text: str, cited_urls: set[str] | None = None
+    ) -> tuple[list[str], set[str]]:
+        """
+        Split tracked sources against the citations in a synthesis.
 
         Args:
             synthesis_text: The synthesis text with Sources section
+            cited_urls: Normalized cited URLs, if already known (skips re-parsing
+                the synthesis)
 
         Returns:
-            List of additional (non-cited) sources
+            Tuple of (additional non-cited sources, normalized cited URLs)
         """
         # Get URLs that are cited in the synthesis
-        cited_urls = self.citation_processor.get_cited_urls_from_synthesis(
-            synthesis_text
-        )
+        if cited_urls is None:
+            cited_urls = self.citation_processor.get_cited_urls_from_synthesis(
+                synthesis_text
+            )
+
+        # Filter tracked URLs to exclude already cited ones and variants of the
+        # same page (using normalized comparison), normalizing each source once
+        seen_urls: set[str] = set()
+        additional_sources = []
+        for source in self._get_sorted_urls():
+            normalized_url = self.normalized_urls[source]
+            if normalized_url in cited_urls or normalized_url in seen_urls:
+                continue
+            seen_urls.add(normalized_url)
+            additional_sources.append(source)
+
+        return additional_sources, cited_urls
+
+    def get_additional_sources(
+        self, synthesis_text: str, cited_urls: set[str] | None = None
+    ) -> list[str]:
+        """
+        Get sources that were tracked but not directly cited in the synthesis.
 
-        # Filter tracked URLs to exclude already cited ones (using normalized comparison)
-        additional_sources = [
-            source
-            for source in self.get_all_sources()
-            if self.citation_processor.normalize_url(source) not in cited_urls
-        ]
+        Args:
+            synthesis_text: The synthesis text with Sources section
+            cited_urls: Normalized cited URLs, if already known (skips re-parsing
+                the synthesis)
 
+        Returns:
+            List of additional (non-cited) sources
+        """
+        additional_sources, _ = self.compute_source_view(synthesis_text, cited_urls)
         return additional_sources
 
-    def get_source_statistics(self, synthesis_text: str) -> dict:
+    def get_source_statistics(
+        self, synthesis_text: str, cited_urls: set[str] | None = None
+    ) -> dict:
         """
         Get statistics about source usage.
 
         Args:
             synthesis_text: The synthesis text with Sources section
+            cited_urls: Normalized cited URLs, if already known (skips re-parsing
+                the synthesis)
 
         Returns:
             Dictionary with source statistics
         """
-        all_sources = self.get_all_sources()
-        additional_sources = self.get_additional_sources(synthesis_text)
-        cited_sources = len(all_sources) - len(additional_sources)
+        if cited_urls is None:
+            cited_urls = self.citation_processor.get_cited_urls_from_synthesis(
+                synthesis_text
+            )
+
+        # Count distinct pages (normalized URLs), the same view that
+        # compute_source_view uses, so that total = cited + additional
+        unique_urls = set(self.normalized_urls.values())
+        total_sources = len(unique_urls)
+        cited_sources = len(unique_urls & cited_urls)
+        additional_sources = total_sources - cited_sources
 
         return {
-            "total_sources": len(all_sources),
+            "total_sources": total_sources,
             "cited_sources": cited_sources,
-            "additional_sources": len(additional_sources),
-            "citation_rate": cited_sources / len(all_sources) if all_sources else 0.0,
+            "additional_sources": additional_sources,
+            "citation_rate": cited_sources / total_sources if total_sources else 0.0,
         }
 
     def clear(self) -> None:
         """Clear all tracked sources."""
         self.tracked_urls.clear()
+        self.normalized_urls.clear()
+        self._sorted_urls = None
 
     def __len__(self) -> int:
         """Return the number of tracked sources."""
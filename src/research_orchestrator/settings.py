@@ -7,6 +7,7 @@ Centralized configuration using Pydantic Settings for type safety and validation
 from functools import lru_cache
 from typing import Literal
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,6 +31,13 @@ class Settings(BaseSettings):
     ollama_host: str = "http://localhost:11434"
     ollama_model: str = "gpt-oss:20b"
 
+    # Workflow settings
+    max_concurrent_workflows: int = Field(default=4, ge=1)
+
+    # Completed research results cache settings
+    results_cache_max_size: int = Field(default=128, ge=1)
+    results_cache_ttl_seconds: float = Field(default=3600.0, ge=0)
+
     @property
     def bedrock_subagent_models_list(self) -> list[str]:
         """Get bedrock_subagent_models as a parsed list."""
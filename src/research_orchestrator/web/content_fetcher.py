@@ -202,17 +202,19 @@ class WebContentFetcher:
             response = await client.get(url, headers=self.DEFAULT_HEADERS)
             response.raise_for_status()
 
-            # Debug logging for response details
-            self.logger.debug(f"🔍 Response for {url}:")
-            self.logger.debug(f"  Status: {response.status_code}")
-            self.logger.debug(
-                f"  Content-Type: {response.headers.get('content-type', 'unknown')}"
-            )
-            self.logger.debug(
-                f"  Content-Encoding: {response.headers.get('content-encoding', 'none')}"
-            )
-            self.logger.debug(f"  Content-Length: {len(response.content)} bytes")
-            self.logger.debug(f"  Text preview: {response.text[:100]}...")
+            # Debug logging for response details (skipped entirely unless enabled,
+            # since the preview decodes the whole response body)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"🔍 Response for {url}:")
+                self.logger.debug(f"  Status: {response.status_code}")
+                self.logger.debug(
+                    f"  Content-Type: {response.headers.get('content-type', 'unknown')}"
+                )
+                self.logger.debug(
+                    f"  Content-Encoding: {response.headers.get('content-encoding', 'none')}"
+                )
+                self.logger.debug(f"  Content-Length: {len(response.content)} bytes")
+                self.logger.debug(f"  Text preview: {response.text[:100]}...")
 
             return response
 
@@ -5,18 +5,48 @@ Provides caching functionality to reduce redundant API calls
 
 import hashlib
 import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from research_orchestrator.types import SearchResults
 
+logger = logging.getLogger("search_cache")
+
 
 class SearchCache:
     """
     Simple file-based cache for search results to reduce API calls
+
+    Several instances, including ones in other processes, may share a cache
+    directory: metadata is reloaded whenever the file changes on disk, and
+    merged with the latest on-disk copy before every write. Concurrent writers
+    in different processes can still race between that reload and the write,
+    in which case the last writer's view of the other's change is lost.
     """
 
+    __slots__ = (
+        "cache_dir",
+        "cache_ttl",
+        "metadata_file",
+        "_metadata",
+        "_metadata_stamp",
+        "_lock",
+        "_memory",
+    )
+
+    # Number of recently read payloads kept in memory to skip the disk read
+    MEMORY_CACHE_SIZE = 256
+
+    # Age after which a leftover temporary file is assumed to be from a crash
+    STALE_TEMP_FILE_SECONDS = 3600
+
     def __init__(self, cache_dir: str = "cache", cache_ttl_hours: float = 24):
         """
         Initialize the search cache
@@ -30,23 +60,102 @@ class SearchCache:
 
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_temp_files(older_than=self.STALE_TEMP_FILE_SECONDS)
 
         # Create cache metadata file if it doesn't exist
         self.metadata_file = self.cache_dir / "cache_metadata.json"
         if not self.metadata_file.exists():
             self._save_metadata({})
 
+        # Keep metadata in memory and write it through on changes, rather than
+        # re-reading the whole file on every lookup and update; the file's stamp
+        # tells when another instance has changed it and it must be reloaded
+        self._metadata_stamp = self._get_metadata_stamp()
+        self._metadata = self._load_metadata()
+
+        # Recently read payloads by cache key, oldest first; expiry is still
+        # decided by the metadata entry, which is checked before this
+        self._memory: OrderedDict[str, SearchResults] = OrderedDict()
+
+        # Guards the in-memory state shared between threads: the metadata, its
+        # file stamp, and the payload LRU
+        self._lock = threading.Lock()
+
+        # Entries from an older key scheme or past their TTL would otherwise stay
+        # on disk forever, since nothing looks them up under their key again
+        self._migrate_cache_keys()
+        self.cleanup_expired()
+
     def _generate_cache_key(self, query: str, count: int) -> str:
         """Generate a unique cache key for a search query"""
         # Create a hash of the query and parameters
         key_data = f"{query.lower().strip()}_{count}"
-        cache_key = hashlib.md5(key_data.encode()).hexdigest()
+        cache_key = hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
         return cache_key
 
+    def _migrate_cache_keys(self) -> None:
+        """Re-key entries written under an older cache key scheme"""
+        try:
+            with self._lock:
+                self._refresh_metadata()
+                migrated = False
+                for cache_key, entry in list(self._metadata.items()):
+                    new_key = self._generate_cache_key(entry["query"], entry["count"])
+                    if new_key == cache_key:
+                        continue
+
+                    # Move the file to its new key, unless that key is already used
+                    migrated = True
+                    del self._metadata[cache_key]
+                    cache_filepath = self._get_cache_filepath(cache_key)
+                    if new_key in self._metadata or not cache_filepath.exists():
+                        cache_filepath.unlink(missing_ok=True)
+                        continue
+                    cache_filepath.replace(self._get_cache_filepath(new_key))
+                    self._metadata[new_key] = entry
+
+                if migrated:
+                    self._write_metadata()
+
+        except Exception as e:
+            logger.warning("Failed to migrate cache keys: %s", e)
+
     def _get_cache_filepath(self, cache_key: str) -> Path:
         """Get the full filepath for a cache key"""
         return self.cache_dir / f"{cache_key}.json"
 
+    def _write_json_atomic(self, filepath: Path, data: Any, **dump_kwargs: Any) -> None:
+        """Write JSON to a temporary file, then rename it over the target"""
+        # Exclusive creation gives the usual umask-based file mode, unlike mkstemp
+        tmp_path = self.cache_dir / f".{filepath.name}.{uuid.uuid4().hex}.tmp"
+        try:
+            with tmp_path.open("x", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+            tmp_path.replace(filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _remove_temp_files(self, older_than: float) -> None:
+        """
+        Remove temporary files left behind by interrupted writes
+
+        Args:
+            older_than: Only remove files at least this many seconds old, so
+                writes in progress in other instances are left alone
+        """
+        now = time.time()
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.startswith(".") and entry.name.endswith(".tmp")):
+                        continue
+                    if now - entry.stat().st_mtime < older_than:
+                        continue
+                    Path(entry.path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to remove temporary cache files: %s", e)
+
     def _load_metadata(self) -> dict[str, Any]:
         """Load cache metadata"""
         try:
@@ -58,16 +167,50 @@ class SearchCache:
     def _save_metadata(self, metadata: dict[str, Any]) -> None:
         """Save cache metadata"""
         try:
-            with Path.open(self.metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self._write_json_atomic(self.metadata_file, metadata, indent=2)
         except Exception as e:
-            print(f"Warning: Failed to save cache metadata: {e}")
+            logger.warning("Failed to save cache metadata: %s", e)
+
+    def _get_metadata_stamp(self) -> tuple[int, int, int] | None:
+        """Identify the current metadata file version (inode, mtime, size)"""
+        try:
+            stat = self.metadata_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _refresh_metadata(self) -> None:
+        """Reload metadata if another instance changed the file (hold the lock)"""
+        stamp = self._get_metadata_stamp()
+        if stamp == self._metadata_stamp:
+            return
+
+        metadata = self._load_metadata()
+        # Drop in-memory payloads whose entries were removed or rewritten
+        for cache_key in list(self._memory):
+            if metadata.get(cache_key) != self._metadata.get(cache_key):
+                del self._memory[cache_key]
+        self._metadata = metadata
+        self._metadata_stamp = stamp
+
+    def _write_metadata(self) -> None:
+        """Save the in-memory metadata and record its stamp (hold the lock)"""
+        self._save_metadata(self._metadata)
+        self._metadata_stamp = self._get_metadata_stamp()
+
+    def _is_cache_expired(
+        self, cached_time: str, cutoff: datetime | None = None
+    ) -> bool:
+        """Check if a cached result has expired
 
-    def _is_cache_expired(self, cached_time: str) -> bool:
-        """Check if a cached result has expired"""
+        Args:
+            cached_time: ISO timestamp the entry was cached at
+            cutoff: Entries cached before this are expired (default: now - TTL)
+        """
+        if cutoff is None:
+            cutoff = datetime.now() - self.cache_ttl
         try:
-            cached_datetime = datetime.fromisoformat(cached_time)
-            return datetime.now() - cached_datetime > self.cache_ttl
+            return datetime.fromisoformat(cached_time) < cutoff
         except (ValueError, TypeError):
             return True  # If we can't parse the time, consider it expired
 
@@ -85,31 +228,47 @@ class SearchCache:
         cache_key = self._generate_cache_key(query, count)
         cache_filepath = self._get_cache_filepath(cache_key)
 
-        # Check if cache file exists
-        if not cache_filepath.exists():
-            return None
-
         # Check metadata for expiration
-        metadata = self._load_metadata()
-        if cache_key not in metadata:
+        with self._lock:
+            self._refresh_metadata()
+            entry = self._metadata.get(cache_key)
+        if entry is None:
             return None
 
         # Check if expired
-        if self._is_cache_expired(metadata[cache_key]["cached_at"]):
+        if self._is_cache_expired(entry["cached_at"]):
             # Clean up expired cache
             self._remove_expired_entry(cache_key)
             return None
 
+        # Serve recently read results without touching the disk
+        with self._lock:
+            cached_results = self._memory.get(cache_key)
+            if cached_results is not None:
+                self._memory.move_to_end(cache_key)
+        if cached_results is not None:
+            logger.debug("🔄 Using cached results for: %s", query)
+            return cached_results
+
+        # Check if cache file exists
+        if not cache_filepath.exists():
+            return None
+
         # Load and return cached results
         try:
             with Path.open(cache_filepath, encoding="utf-8") as f:
                 cached_results = json.load(f)
 
-            print(f"🔄 Using cached results for: {query}")
+            with self._lock:
+                self._memory[cache_key] = cached_results
+                if len(self._memory) > self.MEMORY_CACHE_SIZE:
+                    self._memory.popitem(last=False)
+
+            logger.debug("🔄 Using cached results for: %s", query)
             return cached_results
 
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Warning: Failed to load cached results for {query}: {e}")
+            logger.warning("Failed to load cached results for %s: %s", query, e)
             return None
 
     def set(self, query: str, count: int, results: SearchResults) -> None:
@@ -125,67 +284,98 @@ class SearchCache:
         cache_filepath = self._get_cache_filepath(cache_key)
 
         try:
-            # Save the results
-            with cache_filepath.open("w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-
-            # Update metadata
-            metadata = self._load_metadata()
-            metadata[cache_key] = {
-                "query": query,
-                "count": count,
-                "cached_at": datetime.now().isoformat(),
-                "results_count": results.get("total_results", 0),
-            }
-            self._save_metadata(metadata)
-
-            print(f"💾 Cached results for: {query}")
+            # Save the results as compact JSON; only metadata is meant to be read by hand
+            self._write_json_atomic(cache_filepath, results, separators=(",", ":"))
+
+            # Update metadata and drop any stale in-memory copy
+            with self._lock:
+                self._refresh_metadata()
+                self._memory.pop(cache_key, None)
+                self._metadata[cache_key] = {
+                    "query": query,
+                    "count": count,
+                    "cached_at": datetime.now().isoformat(),
+                    "results_count": results.get("total_results", 0),
+                }
+                self._write_metadata()
+
+            logger.debug("💾 Cached results for: %s", query)
 
         except Exception as e:
-            print(f"Warning: Failed to cache results for {query}: {e}")
+            logger.warning("Failed to cache results for %s: %s", query, e)
 
     def _remove_expired_entry(self, cache_key: str) -> None:
         """Remove an expired cache entry"""
-        try:
-            cache_filepath = self._get_cache_filepath(cache_key)
-            if cache_filepath.exists():
-                cache_filepath.unlink()
+        self._remove_expired_entries([cache_key])
 
-            # Update metadata
-            metadata = self._load_metadata()
-            if cache_key in metadata:
-                del metadata[cache_key]
-                self._save_metadata(metadata)
+    def _remove_expired_entries(
+        self, cache_keys: list[str], cutoff: datetime | None = None
+    ) -> None:
+        """Remove expired cache entries, saving metadata once for the batch
+
+        Args:
+            cache_keys: Keys of the entries found expired
+            cutoff: Expiry cutoff the entries were checked against (default:
+                now - TTL)
+        """
+        try:
+            with self._lock:
+                self._refresh_metadata()
+                removed = False
+                for cache_key in cache_keys:
+                    # Another instance may have refreshed the entry meanwhile
+                    entry = self._metadata.get(cache_key)
+                    if entry is not None and not self._is_cache_expired(
+                        entry["cached_at"], cutoff
+                    ):
+                        continue
+
+                    cache_filepath = self._get_cache_filepath(cache_key)
+                    if cache_filepath.exists():
+                        cache_filepath.unlink()
+
+                    # Update metadata
+                    self._memory.pop(cache_key, None)
+                    if self._metadata.pop(cache_key, None) is not None:
+                        removed = True
+
+                if removed:
+                    self._write_metadata()
 
         except Exception as e:
-            print(f"Warning: Failed to remove expired cache entry: {e}")
+            logger.warning("Failed to remove expired cache entry: %s", e)
 
     def cleanup_expired(self) -> None:
         """Remove all expired cache entries"""
-        metadata = self._load_metadata()
-        expired_keys = []
-
-        for cache_key, entry in metadata.items():
-            if self._is_cache_expired(entry["cached_at"]):
-                expired_keys.append(cache_key)
-
-        for cache_key in expired_keys:
-            self._remove_expired_entry(cache_key)
+        cutoff = datetime.now() - self.cache_ttl
+        with self._lock:
+            self._refresh_metadata()
+            expired_keys = [
+                cache_key
+                for cache_key, entry in self._metadata.items()
+                if self._is_cache_expired(entry["cached_at"], cutoff)
+            ]
 
         if expired_keys:
-            print(f"🧹 Cleaned up {len(expired_keys)} expired cache entries")
+            self._remove_expired_entries(expired_keys, cutoff)
+            logger.info("🧹 Cleaned up %d expired cache entries", len(expired_keys))
 
     def clear_all(self) -> None:
         """Clear all cached results"""
         try:
             # Remove all cache files
-            for filepath in self.cache_dir.iterdir():
-                if filepath.suffix == ".json":
-                    filepath.unlink()
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        Path(entry.path).unlink(missing_ok=True)
+            self._remove_temp_files(older_than=self.STALE_TEMP_FILE_SECONDS)
 
             # Reset metadata
-            self._save_metadata({})
-            print("🗑️ Cleared all cached search results")
+            with self._lock:
+                self._metadata = {}
+                self._memory.clear()
+                self._write_metadata()
+            logger.info("🗑️ Cleared all cached search results")
 
         except Exception as e:
-            print(f"Warning: Failed to clear cache: {e}")
+            logger.warning("Failed to clear cache: %s", e)
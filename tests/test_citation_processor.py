@@ -53,6 +53,9 @@ class TestCitationProcessor:
         # Test empty string
         assert self.processor.normalize_url("") == ""
 
+        # Test fallback when urlparse rejects the URL
+        assert self.processor.normalize_url(" HTTP://[::1/Path ") == "http://[::1/path"
+
         # Test whitespace handling
         assert (
             self.processor.normalize_url("  https://example.com/  ")
@@ -81,6 +84,39 @@ class TestCitationProcessor:
             "3", "Site Three", "Article Title Three", "https://example3.com/post"
         )
 
+    def test_extract_citations_skips_malformed_lines(self):
+        """Test that only well-formed citation lines are extracted."""
+        text = """
+        - [1] Site One – "Title – With Dash" – https://example1.com/article
+        [x] Not A Number – "Title" – https://example2.com
+        [2] Missing Title – https://example3.com
+        [3] Bad Scheme – "Title" – ftp://example4.com
+        [4] Site Four – "Title Four" – https://example4.com/page trailing text
+        """
+
+        citations = self.processor.extract_citations(text)
+
+        assert citations == [
+            CitationEntry(
+                "1", "Site One", "Title – With Dash", "https://example1.com/article"
+            ),
+            CitationEntry("4", "Site Four", "Title Four", "https://example4.com/page"),
+        ]
+
+    def test_extract_citations_multiple_per_line(self):
+        """Test that every citation entry on a line is extracted."""
+        text = (
+            '[1] Site One – "Title One" – https://example1.com/a; '
+            '[x] Not A Citation [2] Site Two – "Title Two" – https://example2.com/b'
+        )
+
+        citations = self.processor.extract_citations(text)
+
+        assert citations == [
+            CitationEntry("1", "Site One", "Title One", "https://example1.com/a;"),
+            CitationEntry("2", "Site Two", "Title Two", "https://example2.com/b"),
+        ]
+
     def test_extract_sources_section(self):
         """Test extraction of Sources section from text."""
         text = """
@@ -158,6 +194,84 @@ This mentions source [1] and also [2].
         citations = self.processor.extract_citations(sources_section)
         assert len(citations) == 1
 
+        # Cited URLs match what re-parsing the updated text would produce
+        assert result.cited_urls == self.processor.get_cited_urls_from_synthesis(
+            result.updated_text
+        )
+
+    def test_deduplicate_citation_urls_renumbers_in_single_pass(self):
+        """Test that swapped citation numbers are not rewritten twice."""
+        synthesis = """# Research Report
+
+First [2], then [1], again [3]. Unlisted [7] stays.
+
+## Sources
+
+[2] Site A – "Article A" – https://a.example.com/page
+[1] Site B – "Article B" – https://b.example.com/page
+[3] Site A – "Article A Again" – https://a.example.com/page/
+"""
+
+        result = self.processor.deduplicate_citation_urls(synthesis)
+
+        assert result.deduplicated_count == 1
+        assert result.final_count == 2
+        assert (
+            "First [1], then [2], again [1]. Unlisted [7] stays." in result.updated_text
+        )
+
+        sources_section = self.processor.extract_sources_section(result.updated_text)
+        assert sources_section is not None
+        citations = self.processor.extract_citations(sources_section)
+        assert [(c.old_num, c.url) for c in citations] == [
+            ("1", "https://a.example.com/page"),
+            ("2", "https://b.example.com/page"),
+        ]
+
+    def test_deduplicate_citation_urls_already_unique(self):
+        """Test that text with unique, sequential citations is returned unchanged."""
+        synthesis = """# Research Report
+
+See [1] and [2].
+
+## Sources
+
+[1]  Site One – "Article One" – https://example1.com/page
+[2] Site Two – "Article Two" – https://example2.com/page
+"""
+
+        result = self.processor.deduplicate_citation_urls(synthesis)
+
+        assert result.updated_text is synthesis
+        assert result.deduplicated_count == 0
+        assert result.final_count == 2
+        assert result.cited_urls == {
+            "https://example1.com/page",
+            "https://example2.com/page",
+        }
+
+    def test_deduplicate_citation_urls_keeps_unparsed_urls_cited(self):
+        """Test that URLs on kept but unparseable Sources lines count as cited."""
+        synthesis = """# Research Report
+
+See [1], [2] and [3].
+
+## Sources
+
+[1] Site One – "Article One" – https://example1.com/page
+[2] Site Two – "Article Two" – https://example2.com/page
+[3] https://example3.com/raw-link
+"""
+
+        result = self.processor.deduplicate_citation_urls(synthesis)
+
+        assert result.updated_text is synthesis
+        assert result.final_count == 2
+        assert "https://example3.com/raw-link" in result.cited_urls
+        assert result.cited_urls == self.processor.get_cited_urls_from_synthesis(
+            synthesis
+        )
+
     def test_deduplicate_citation_urls_no_sources(self):
         """Test deduplication when no Sources section exists."""
         synthesis = "# Research Report\n\nNo sources here."
@@ -0,0 +1,69 @@
+"""
+Tests for the MCP server's workflow concurrency limit.
+"""
+
+import builtins
+import importlib
+import sys
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from research_orchestrator.settings import Settings, get_settings
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Import the server module fresh, without BRAVE_API_KEY or a .env file."""
+    # The server redirects print() on import; restore it afterwards
+    monkeypatch.setattr(builtins, "print", builtins.print)
+    monkeypatch.delenv("BRAVE_API_KEY", raising=False)
+    monkeypatch.chdir(tmp_path)
+    get_settings.cache_clear()
+    sys.modules.pop("mcp_server.server", None)
+
+    yield importlib.import_module("mcp_server.server")
+
+    get_settings.cache_clear()
+
+
+class TestWorkflowSlots:
+    """Test cases for the lazily created workflow semaphore"""
+
+    def test_import_does_not_require_settings(self, server):
+        """Test that importing the server doesn't read settings"""
+        assert server._workflow_slots is None
+
+    def test_workflow_slots_created_once_from_settings(self, server):
+        """Test that the semaphore is sized from settings on first use"""
+        settings = Settings(brave_api_key="test-key", max_concurrent_workflows=2)  # type: ignore
+        with patch.object(server, "get_settings", return_value=settings):
+            slots = server.get_workflow_slots()
+            assert server.get_workflow_slots() is slots
+
+        assert slots.acquire(blocking=False)
+        assert slots.acquire(blocking=False)
+        assert not slots.acquire(blocking=False)
+
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_max_concurrent_workflows_must_be_positive(self, value):
+        """Test that a limit that would stall or crash job execution is rejected"""
+        with pytest.raises(ValidationError):
+            Settings(brave_api_key="test-key", max_concurrent_workflows=value)  # type: ignore
+
+    @pytest.mark.parametrize("env", [{}, {"MAX_CONCURRENT_WORKFLOWS": "0"}])
+    def test_job_fails_when_settings_fail_to_load(self, server, monkeypatch, env):
+        """Test that a job is marked failed, not left pending, if settings are invalid"""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        if env:
+            monkeypatch.setenv("BRAVE_API_KEY", "test-key")
+
+        job_id = server.create_job("Test Topic")
+        server.execute_research_job_sync(job_id, "Test Topic")
+
+        job = server.get_job(job_id)
+        assert job["status"] == server.JobStatus.FAILED
+        assert job["error"]
+        assert server._workflow_slots is None
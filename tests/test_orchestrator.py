@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from research_orchestrator import orchestrator as orchestrator_module
 from research_orchestrator.orchestrator import (
     ResearchOrchestrator,
     extract_content_text,
@@ -19,6 +20,17 @@ from research_orchestrator.processing import (
     ResultFormatter,
     SourceTracker,
 )
+from research_orchestrator.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def results_cache_settings():
+    """Give each test an empty results cache and known cache settings."""
+    settings = Settings(brave_api_key="test-key")  # type: ignore
+    orchestrator_module._results_cache.clear()
+    with patch.object(orchestrator_module, "get_settings", return_value=settings):
+        yield settings
+    orchestrator_module._results_cache.clear()
 
 
 class TestExtractContentText:
@@ -408,6 +420,40 @@ class TestResearchOrchestrator:
         )
         assert any("Research workflow completed" in call for call in log_calls)
 
+    @pytest.mark.asyncio
+    async def test_conduct_research_reuses_cached_results(self, orchestrator):
+        """Test that repeated topics are served from the results cache."""
+        expected_result = {
+            "main_topic": "Cached Topic",
+            "subtopics_count": 0,
+            "subtopic_research": [],
+            "master_synthesis": "Cached synthesis",
+            "summary": "Cached summary",
+            "generated_at": "2024-01-01T00:00:00",
+            "total_unique_sources": 0,
+            "all_sources_used": [],
+        }
+
+        orchestrator.complete_research_workflow = AsyncMock(
+            return_value=expected_result
+        )
+
+        first = await orchestrator.conduct_research("Cached Topic")
+        # Case and whitespace differences should hit the same entry
+        second = await orchestrator.conduct_research("  cached   TOPIC ")
+
+        orchestrator.complete_research_workflow.assert_called_once_with("Cached Topic")
+        assert first == second == expected_result
+
+    def test_results_cache_size_comes_from_settings(self, results_cache_settings):
+        """Test that the results cache evicts beyond the configured size."""
+        results_cache_settings.results_cache_max_size = 2
+        for topic in ["Topic A", "Topic B", "Topic C"]:
+            orchestrator_module.cache_results(topic, {"main_topic": topic})  # type: ignore
+
+        assert orchestrator_module.get_cached_results("Topic A") is None
+        assert orchestrator_module.get_cached_results("Topic C") is not None
+
     @pytest.mark.asyncio
     async def test_workflow_uuid_generation(self, orchestrator):
         """Test that each workflow gets a unique ID for tracking."""
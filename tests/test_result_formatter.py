@@ -5,6 +5,8 @@ Tests result formatting, additional sources section creation, and ResearchResult
 object creation in isolation from the rest of the research system.
 """
 
+from unittest.mock import patch
+
 from src.research_orchestrator.processing.result_formatter import ResultFormatter
 from src.research_orchestrator.processing.source_tracker import SourceTracker
 
@@ -46,6 +48,21 @@ class TestResultFormatter:
         # Should return unchanged synthesis
         assert result == synthesis
 
+    def test_format_additional_sources(self):
+        """Test formatting the additional sources section with a total count."""
+        section = self.formatter.format_additional_sources(
+            ["https://example1.com", "https://example2.com"], total_sources=5
+        )
+
+        assert section == (
+            "\n\n## Additional Research Sources\n\n"
+            "The following sources were also consulted during research "
+            "but may not be directly cited above:\n\n"
+            "- https://example1.com\n"
+            "- https://example2.com\n"
+            "\nAdditional sources: 2 | Total sources consulted: 5"
+        )
+
     def test_create_research_results(self):
         """Test creating ResearchResults object."""
         # Set up source tracker
@@ -171,6 +188,92 @@ class TestResultFormatter:
         # Should be unchanged (no additional sources to add)
         assert result.strip() == synthesis.strip()
 
+    def test_process_synthesis_unparsed_source_not_repeated(self):
+        """Test that a kept Sources line the parser skips isn't listed again."""
+        sources = ["https://cited1.com", "https://raw.com/link", "https://extra.com"]
+        self.source_tracker.add_urls(sources)
+
+        synthesis = """# Report
+
+## Sources
+
+[1] Site – "Article" – https://cited1.com
+[2] https://raw.com/link
+"""
+
+        result = self.formatter.process_synthesis_with_sources(
+            synthesis, self.source_tracker
+        )
+
+        additional = result.split("## Additional Research Sources", 1)[1]
+        assert "https://raw.com/link" not in additional
+        assert "- https://extra.com" in additional
+
+    def test_cited_urls_shared_with_create_research_results(self):
+        """Test that the synthesis is parsed once across processing and results."""
+        self.source_tracker.add_urls(["https://cited1.com", "https://extra.com"])
+
+        synthesis = """# Report
+
+## Sources
+
+[1] Site – "Article" – https://cited1.com
+"""
+
+        processor = self.source_tracker.citation_processor
+        with patch.object(
+            processor,
+            "get_cited_urls_from_synthesis",
+            wraps=processor.get_cited_urls_from_synthesis,
+        ) as parse:
+            processed, cited_urls = self.formatter.process_synthesis_with_citations(
+                synthesis, self.source_tracker, apply_deduplication=False
+            )
+            result = self.formatter.create_research_results(
+                main_topic="Test Topic",
+                master_synthesis=processed,
+                source_tracker=self.source_tracker,
+                cited_urls=cited_urls,
+            )
+
+        assert parse.call_count == 1
+        assert cited_urls == {"https://cited1.com"}
+        assert "1 directly cited, 1 additional" in result["summary"]
+
+    def test_url_variants_counted_once(self):
+        """Test that URL variants of one page count as a single source everywhere."""
+        sources = [
+            "https://cited1.com/page",
+            "https://cited1.com/page/",
+            "https://extra.com/a?ref=1",
+            "https://extra.com/a#top",
+        ]
+        self.source_tracker.add_urls(sources)
+
+        synthesis = """# Report
+
+## Sources
+
+[1] Site – "Article" – https://cited1.com/page
+"""
+
+        processed = self.formatter.process_synthesis_with_sources(
+            synthesis, self.source_tracker
+        )
+        result = self.formatter.create_research_results(
+            main_topic="Test Topic",
+            master_synthesis=processed,
+            source_tracker=self.source_tracker,
+        )
+
+        assert "Total sources consulted: 2" in processed
+        assert result["total_unique_sources"] == 2
+        assert result["all_sources_used"] == [
+            "https://cited1.com/page",
+            "https://extra.com/a#top",
+        ]
+        assert "2 unique sources" in result["summary"]
+
     def test_integration_with_source_tracker(self):
         """Test integration between ResultFormatter and SourceTracker."""
         # This tests the interaction between components
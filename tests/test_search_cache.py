@@ -2,10 +2,13 @@
 Tests for SearchCache module
 """
 
+import hashlib
 import json
+import logging
+import os
 import tempfile
 import time
-from datetime import timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
@@ -192,6 +195,112 @@ class TestSearchCache:
             cached_data = json.load(f)
             assert cached_data == sample_search_results
 
+    def test_failed_write_keeps_previous_cache_file(self, cache, sample_search_results):
+        """Test that an interrupted write leaves the old file and no temp files"""
+        query = "AWS Bedrock throttling"
+        count = 10
+        cache.set(query, count, sample_search_results)
+
+        # A value json can't serialize fails partway through the dump
+        cache.set(query, count, {"results": [object()]})  # type: ignore
+
+        assert cache.get(query, count) == sample_search_results
+        assert not list(cache.cache_dir.glob("*.tmp"))
+
+    def test_cache_files_use_default_file_mode(self, cache, sample_search_results):
+        """Test that atomic writes keep the umask-based mode of a plain write"""
+        cache.set("AWS Bedrock throttling", 10, sample_search_results)
+
+        plain_file = cache.cache_dir / "plain.txt"
+        plain_file.write_text("")
+        expected_mode = plain_file.stat().st_mode
+
+        cache_key = cache._generate_cache_key("AWS Bedrock throttling", 10)
+        assert cache._get_cache_filepath(cache_key).stat().st_mode == expected_mode
+        assert cache.metadata_file.stat().st_mode == expected_mode
+
+    def test_stale_temp_files_removed_on_startup(self, temp_cache_dir):
+        """Test that temp files left by a crash are cleaned up, recent ones kept"""
+        stale_file = Path(temp_cache_dir) / ".abc.json.stale.tmp"
+        recent_file = Path(temp_cache_dir) / ".abc.json.recent.tmp"
+        stale_file.write_text("{")
+        recent_file.write_text("{")
+        stale_time = time.time() - SearchCache.STALE_TEMP_FILE_SECONDS - 60
+        os.utime(stale_file, (stale_time, stale_time))
+
+        SearchCache(cache_dir=temp_cache_dir)
+
+        assert not stale_file.exists()
+        assert recent_file.exists()
+
+    def test_legacy_and_expired_entries_pruned_on_startup(
+        self, temp_cache_dir, sample_search_results
+    ):
+        """Test that MD5-keyed entries are re-keyed and expired ones removed"""
+        cache_dir = Path(temp_cache_dir)
+        legacy_key = hashlib.md5(b"legacy query_10").hexdigest()
+        expired_key = hashlib.md5(b"expired query_10").hexdigest()
+        metadata = {
+            legacy_key: {
+                "query": "legacy query",
+                "count": 10,
+                "cached_at": datetime.now().isoformat(),
+                "results_count": 3,
+            },
+            expired_key: {
+                "query": "expired query",
+                "count": 10,
+                "cached_at": (datetime.now() - timedelta(days=2)).isoformat(),
+                "results_count": 3,
+            },
+        }
+        for key in metadata:
+            (cache_dir / f"{key}.json").write_text(json.dumps(sample_search_results))
+        (cache_dir / "cache_metadata.json").write_text(json.dumps(metadata))
+
+        cache = SearchCache(cache_dir=temp_cache_dir)
+
+        new_key = cache._generate_cache_key("legacy query", 10)
+        assert cache._load_metadata().keys() == {new_key}
+        assert sorted(p.name for p in cache_dir.glob("*.json")) == sorted(
+            ["cache_metadata.json", f"{new_key}.json"]
+        )
+        assert cache.get("legacy query", 10) == sample_search_results
+
+    def test_repeated_get_served_from_memory(self, cache, sample_search_results):
+        """Test that results read once are served without re-reading the file"""
+        query = "AWS Bedrock throttling"
+        count = 10
+        cache.set(query, count, sample_search_results)
+        assert cache.get(query, count) == sample_search_results
+
+        with patch.object(Path, "open", side_effect=AssertionError("disk read")):
+            assert cache.get(query, count) == sample_search_results
+
+        # Re-setting the entry drops the in-memory copy
+        updated_results = {**sample_search_results, "total_results": 0}
+        cache.set(query, count, updated_results)  # type: ignore
+        assert cache.get(query, count) == updated_results
+
+    def test_memory_cache_is_bounded(
+        self, temp_cache_dir, sample_search_results, monkeypatch
+    ):
+        """Test that the in-memory layer evicts the least recently used entry"""
+        monkeypatch.setattr(SearchCache, "MEMORY_CACHE_SIZE", 2)
+        cache = SearchCache(cache_dir=temp_cache_dir)
+        for query in ["query1", "query2", "query3"]:
+            cache.set(query, 10, sample_search_results)
+
+        cache.get("query1", 10)
+        cache.get("query2", 10)
+        cache.get("query1", 10)
+        cache.get("query3", 10)
+
+        assert list(cache._memory) == [
+            cache._generate_cache_key("query1", 10),
+            cache._generate_cache_key("query3", 10),
+        ]
+
     def test_expired_entry_removal(self, temp_cache_dir, sample_search_results):
         """Test that expired entries are properly removed"""
         # Create cache with very short TTL
@@ -324,19 +433,19 @@ class TestSearchCache:
         # Should consider invalid datetime as expired
         assert cache._is_cache_expired("invalid_datetime") is True
 
-    @patch("builtins.print")
-    def test_cache_console_output(self, mock_print, cache, sample_search_results):
-        """Test that cache operations produce appropriate console output"""
+    def test_cache_log_output(self, cache, sample_search_results, caplog):
+        """Test that cache operations produce appropriate debug log messages"""
         query = "AWS Bedrock throttling"
         count = 10
+        caplog.set_level(logging.DEBUG, logger="search_cache")
 
-        # Set cache should print cache message
+        # Set cache should log cache message
         cache.set(query, count, sample_search_results)
-        mock_print.assert_called_with(f"💾 Cached results for: {query}")
+        assert caplog.messages[-1] == f"💾 Cached results for: {query}"
 
-        # Get cache should print cache hit message
+        # Get cache should log cache hit message
         cache.get(query, count)
-        mock_print.assert_called_with(f"🔄 Using cached results for: {query}")
+        assert caplog.messages[-1] == f"🔄 Using cached results for: {query}"
 
     def test_cache_with_special_characters(self, cache, sample_search_results):
         """Test cache with special characters in query"""
@@ -376,6 +485,67 @@ class TestSearchCache:
         result = cache2.get(query, count)
         assert result == sample_search_results
 
+    def test_instances_sharing_directory_keep_each_others_entries(
+        self, temp_cache_dir, sample_search_results
+    ):
+        """Test that two caches on one directory see and preserve each other's writes"""
+        cache_a = SearchCache(cache_dir=temp_cache_dir)
+        cache_b = SearchCache(cache_dir=temp_cache_dir)
+
+        cache_b.set("query from b", 10, sample_search_results)
+        assert cache_a.get("query from b", 10) == sample_search_results
+
+        cache_a.set("query from a", 10, sample_search_results)
+
+        fresh_cache = SearchCache(cache_dir=temp_cache_dir)
+        assert fresh_cache.get("query from a", 10) == sample_search_results
+        assert fresh_cache.get("query from b", 10) == sample_search_results
+
+    def test_cleanup_expired_saves_metadata_once(
+        self, temp_cache_dir, sample_search_results
+    ):
+        """Test that cleaning up many expired entries writes metadata once"""
+        cache = SearchCache(cache_dir=temp_cache_dir, cache_ttl_hours=1 / 3600)
+        for query in ["query1", "query2", "query3"]:
+            cache.set(query, 10, sample_search_results)
+
+        time.sleep(2)
+
+        with patch.object(
+            SearchCache,
+            "_save_metadata",
+            autospec=True,
+            side_effect=SearchCache._save_metadata,
+        ) as mock_save:
+            cache.cleanup_expired()
+
+        assert mock_save.call_count == 1
+        assert cache._load_metadata() == {}
+
+    def test_cleanup_expired_rechecks_with_same_cutoff(
+        self, temp_cache_dir, sample_search_results
+    ):
+        """Test that removal re-checks entries against the cleanup's cutoff"""
+        cache = SearchCache(cache_dir=temp_cache_dir, cache_ttl_hours=1 / 3600)
+        for query in ["query1", "query2"]:
+            cache.set(query, 10, sample_search_results)
+
+        time.sleep(2)
+
+        with patch.object(
+            SearchCache,
+            "_is_cache_expired",
+            autospec=True,
+            side_effect=SearchCache._is_cache_expired,
+        ) as mock_expired:
+            cache.cleanup_expired()
+
+        cutoffs = {call.args[2] for call in mock_expired.call_args_list}
+        assert mock_expired.call_count == 4
+        assert len(cutoffs) == 1
+        assert None not in cutoffs
+        assert cache._load_metadata() == {}
+
     def test_cache_ttl_configuration(self, temp_cache_dir):
         """Test different TTL configurations"""
         # Test various TTL values
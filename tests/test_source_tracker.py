@@ -40,6 +40,18 @@ class TestSourceTracker:
 
         assert len(self.tracker) == 1
 
+    def test_normalized_urls_tracked(self):
+        """Test that tracked URLs are normalized once when added."""
+        self.tracker.add_urls(["https://Example.com/Page/", "https://other.com"])
+
+        assert self.tracker.normalized_urls == {
+            "https://Example.com/Page/": "https://example.com/page",
+            "https://other.com": "https://other.com",
+        }
+
+        self.tracker.clear()
+        assert self.tracker.normalized_urls == {}
+
     def test_get_all_sources_sorted(self):
         """Test that get_all_sources returns sorted list."""
         urls = ["https://zebra.com", "https://apple.com", "https://banana.com"]
@@ -49,6 +61,21 @@ class TestSourceTracker:
 
         assert sources == sorted(urls)
 
+    def test_get_all_sources_after_changes(self):
+        """Test that the sorted source list reflects later additions and clears."""
+        self.tracker.add_url("https://zebra.com")
+        sources = self.tracker.get_all_sources()
+        sources.append("https://mutated.com")  # Callers get their own copy
+
+        self.tracker.add_url("https://apple.com")
+        assert self.tracker.get_all_sources() == [
+            "https://apple.com",
+            "https://zebra.com",
+        ]
+
+        self.tracker.clear()
+        assert self.tracker.get_all_sources() == []
+
     def test_get_additional_sources(self):
         """Test filtering additional sources from synthesis."""
         # Add tracked URLs
@@ -88,6 +115,21 @@ class TestSourceTracker:
         # All sources should be considered additional
         assert set(additional) == {"https://example1.com", "https://example2.com"}
 
+    def test_compute_source_view(self):
+        """Test computing additional sources and cited URLs together."""
+        self.tracker.add_urls(["https://cited.com/page/", "https://additional.com"])
+
+        synthesis = """
+        ## Sources
+
+        [1] Site – "Article" – https://cited.com/page
+        """
+
+        additional, cited_urls = self.tracker.compute_source_view(synthesis)
+
+        assert additional == ["https://additional.com"]
+        assert cited_urls == {"https://cited.com/page"}
+
     def test_get_source_statistics(self):
         """Test source usage statistics."""
         # Add sources
@@ -167,3 +209,33 @@ class TestSourceTracker:
         # Only the non-matching URL should be additional
         # (https://example.com/page should match https://example.com/page/ after normalization)
         assert additional == ["https://other.com/article"]
+
+    def test_get_additional_sources_skips_url_variants(self):
+        """Test that variants of the same additional URL are only listed once."""
+        self.tracker.add_urls(
+            [
+                "https://example.com/page",
+                "https://example.com/page/",
+                "https://example.com/page?ref=feed",
+                "https://other.com/article",
+            ]
+        )
+
+        synthesis = """
+        ## Sources
+
+        [1] Site – "Article" – https://other.com/article
+        """
+
+        additional = self.tracker.get_additional_sources(synthesis)
+
+        assert additional == ["https://example.com/page"]
+
+        stats = self.tracker.get_source_statistics(synthesis)
+        assert stats["total_sources"] == 2
+        assert stats["cited_sources"] == 1
+        assert stats["additional_sources"] == 1
+        assert (
+            stats["total_sources"]
+            == stats["cited_sources"] + stats["additional_sources"]
+        )